@@ -3,6 +3,7 @@ from .transpiler import transpile_chain
 from .transpiler import transpile_right
 from .transpiler import transpile_left
 from .transpiler import get_full_map
+from .transpiler import remove_unused_qubits
 
 from .functions import get_litmus_circuit
 from .functions import get_cnot_circuit
@@ -10,6 +11,7 @@ from .functions import get_sinusoids
 from .functions import get_ibm_cost
 from .functions import get_circuit_hash
 
+from .metrics import get_gates_counter
 from .metrics import transpile_and_return_metrics
 
 from .topological_compression import get_used_qubit_indices
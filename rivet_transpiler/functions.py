@@ -3,12 +3,18 @@
 import qiskit
 
 import hashlib
+import struct
 
 import numpy as np
 
 from collections import deque
 
 
+# Module-level random generator - avoids numpy global-state contention
+
+RNG = np.random.default_rng()
+
+
 # 1) Get Litmus Circuit
 
 def get_litmus_circuit(qubits_count, circuit_name=None, registers_count=1):
@@ -148,16 +154,17 @@ def get_sinusoids(qubits_count,
 
     if frequencies is None:
 
-        frequencies = np.random.uniform(low=1,
-                                        high=samples_count // 2,
-                                        size=(frequencies_count,)).astype(int)
+        frequencies = RNG.integers(low=1,
+                                   high=samples_count // 2,
+                                   size=frequencies_count,
+                                   dtype=np.int64)
     if amplitudes is None:
 
         frequencies_count = len(frequencies)
 
-        amplitudes = np.random.uniform(low=min_amplitude,
-                                       high=max_amplitude,
-                                       size=(frequencies_count,))
+        amplitudes = RNG.uniform(low=min_amplitude,
+                                 high=max_amplitude,
+                                 size=frequencies_count)
 
     sinusoids = np.zeros(samples_count)
 
@@ -207,11 +214,20 @@ def get_ibm_cost(qiskit_circuit,
 
     # Circuit
 
-    remove_barriers_pass = qiskit.transpiler.passes.RemoveBarriers()
+    if qiskit_circuit.num_clbits == 0 and 'barrier' not in qiskit_circuit.count_ops():
+
+        # No barriers to remove and no measurements possible -
+        # skip the rebuild passes and read the input directly
+
+        circuit = qiskit_circuit
 
-    circuit = remove_barriers_pass(qiskit_circuit)
+    else:
 
-    circuit.remove_final_measurements()
+        remove_barriers_pass = qiskit.transpiler.passes.RemoveBarriers()
+
+        circuit = remove_barriers_pass(qiskit_circuit)
+
+        circuit.remove_final_measurements()
 
     # Fidelities
 
@@ -244,7 +260,7 @@ def get_circuit_hash(circuit, decomposition_level=None):
     """
     Calculate hash for Qiskit quantum circuit.
 
-    This function computes a SHA256 hash value that represents a given quantum circuit.
+    This function computes a BLAKE2b hash value that represents a given quantum circuit.
     It traverses circuit DAG, iterates over instructions, including the quantum operations and their parameters,
     and combines them to generate a hash value.
     Optionally, the traversal can be limited to a specified decomposition level.
@@ -275,10 +291,10 @@ def get_circuit_hash(circuit, decomposition_level=None):
     >>> my_circuit.cx(0, 1)
     >>> hash_value = get_circuit_hash(my_circuit)
     >>> print(hash_value)
-    "62559021281660068776592236282478300669138546894602824343710100835365445539986"
+    "9766560655854792866550715725467191566080476854477015993171395478935837861571"
     """
 
-    hash_object = hashlib.sha256(b'')
+    hash_object = hashlib.blake2b(digest_size=32)
 
     # Circuit Traversal
 
@@ -326,29 +342,44 @@ def get_circuit_hash(circuit, decomposition_level=None):
 
                 # Calculate Hash of Leaf Node
 
-                # Collect Values
+                # Encode Operation - fixed binary layout instead of
+                # repr strings; struct.pack avoids the per-value
+                # formatting and intermediate string allocation
+
+                name_bytes = operation.name.encode('utf-8')
+
+                hash_object.update(struct.pack(
+                    '<HHH',
+                    len(absolute_qubits),
+                    len(absolute_bits),
+                    len(name_bytes)))
+
+                hash_object.update(np.asarray(absolute_qubits,
+                                              dtype='<i4').tobytes())
+                hash_object.update(np.asarray(absolute_bits,
+                                              dtype='<i4').tobytes())
 
-                values = [absolute_qubits,
-                          absolute_bits,
-                          operation.name]
+                hash_object.update(name_bytes)
 
-                # Collect Parameters
+                # Encode Parameters - a type tag keeps float, skipped
+                # ParameterExpression and fallback values distinct
 
                 for parameter in operation.params:
 
                     if isinstance(parameter, qiskit.circuit.parameter.ParameterExpression):
 
-                        parameter = None
+                        hash_object.update(b'\x00')
 
-                    values.append(parameter)
+                    elif isinstance(parameter, (int, float)):
 
-                # Update Hash
+                        hash_object.update(struct.pack('<Bd', 1, parameter))
 
-                for value in values:
+                    else:
 
-                    encoded_value = repr(value).encode('utf-8')
+                        encoded_value = repr(parameter).encode('utf-8')
 
-                    hash_object.update(encoded_value)
+                        hash_object.update(struct.pack('<BI', 2, len(encoded_value)))
+                        hash_object.update(encoded_value)
 
             else:
 
@@ -1,12 +1,96 @@
 """ Functions for calculation of transpilation metrics. """
 
-from collections import Counter
-
-from qiskit.converters import dag_to_circuit
+import numpy as np
 
 from rivet_transpiler.transpiler import transpile
 
-from rivet_transpiler.functions import get_ibm_cost
+
+def get_gates_counter(dag):
+
+    """
+    Count DAG operations by qubit arity.
+
+    Counts in C via `np.bincount` instead of sorting the arities and
+    feeding them to a Counter - the callback below runs after every
+    transpiler pass, so this is on the metrics hot path.
+
+    Args:
+        dag (DAGCircuit): The input Qiskit DAG circuit.
+
+    Returns:
+        dict: Mapping from qubit count to number of operations.
+    """
+
+    dag_nodes = dag.op_nodes(include_directives=False)
+
+    qubit_counts = np.fromiter((node.op.num_qubits for node in dag_nodes),
+                               dtype=np.intp,
+                               count=len(dag_nodes))
+
+    counts = np.bincount(qubit_counts)
+
+    gates_counter = {int(arity): int(count)
+                     for arity, count in enumerate(counts)
+                     if count}
+
+    return gates_counter
+
+
+def get_ibm_cost_from_dag(dag,
+                          depth_penalty_factor=0.995,
+                          one_qubit_gate_fidelity=0.9996,
+                          two_qubit_gate_fidelity=0.99):
+
+    """
+    Calculate the IBM Cost directly from a Qiskit DAG circuit.
+
+    DAG counterpart of `get_ibm_cost` - used by the metrics callback
+    to avoid a full `dag_to_circuit` conversion after every pass.
+    Barriers and measurements are ignored.
+
+    Args:
+        dag (DAGCircuit): The input Qiskit DAG circuit.
+        depth_penalty_factor (float, optional): A factor for depth penalty.
+        one_qubit_gate_fidelity (float, optional): Fidelity of one-qubit gates.
+        two_qubit_gate_fidelity (float, optional): Fidelity of two-qubit gates.
+
+    Returns:
+        float: The calculated IBM Cost.
+    """
+
+    fidelity_product = 1
+
+    qubit_depths = dict.fromkeys(dag.qubits, 0)
+
+    for node in dag.topological_op_nodes():
+
+        if getattr(node.op, '_directive', False) or node.op.name == 'measure':
+            continue
+
+        qubit_count = node.op.num_qubits
+
+        if qubit_count == 1:
+            fidelity_product *= one_qubit_gate_fidelity
+
+        elif qubit_count == 2:
+            fidelity_product *= two_qubit_gate_fidelity
+
+        else:
+            raise ValueError(f"More then 2-qubit {node.op}")
+
+        # Critical Path
+
+        node_depth = 1 + max(qubit_depths[qubit] for qubit in node.qargs)
+
+        for qubit in node.qargs:
+
+            qubit_depths[qubit] = node_depth
+
+    depth = max(qubit_depths.values(), default=0)
+
+    ibm_cost = depth_penalty_factor ** depth * fidelity_product
+
+    return ibm_cost
 
 
 def transpile_and_return_metrics(circuit, backend=None, **key_arguments):
@@ -71,15 +155,9 @@ def transpile_and_return_metrics(circuit, backend=None, **key_arguments):
         depth = dag.depth()
         width = dag.width()
 
-        circuit = dag_to_circuit(dag)
-
         # Gates Counter
 
-        dag_nodes = dag.op_nodes(include_directives=False)
-
-        qubit_counts = sorted(node.op.num_qubits for node in dag_nodes)
-
-        gates_counter = dict(Counter(qubit_counts))
+        gates_counter = get_gates_counter(dag)
 
         # Pass Type
 
@@ -93,7 +171,7 @@ def transpile_and_return_metrics(circuit, backend=None, **key_arguments):
         # IBM Cost
 
         try:
-            ibm_cost = get_ibm_cost(circuit)
+            ibm_cost = get_ibm_cost_from_dag(dag)
 
         except ValueError:
 
@@ -1,30 +1,20 @@
 """ Pre-defined transpilation stacks for QML Transpiler. """
 
-import numpy as np
-
-import warnings
+import atexit
+import functools
+import itertools
+import os
+import sys
 
 from importlib.util import find_spec
 
 import qiskit
 
-from qiskit.qasm2 import dumps
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from qiskit_ibm_runtime.fake_provider import fake_backend
 
-try:
-    import bqskit
-
-except ModuleNotFoundError:
-    warnings.warn("BQSKit not found", ImportWarning)
-
-try:
-    import pytket
-    import pytket.extensions.qiskit
-
-except ModuleNotFoundError:
-    warnings.warn("Pytket not found", ImportWarning)
+from rivet_transpiler.functions import get_circuit_hash
 
 # Qiskit Aer Simulator Properties
 
@@ -34,14 +24,57 @@ AER_SIMULATOR_COUPLING_MAP = None
 
 # Check Module Function
 
+@functools.lru_cache(maxsize=None)
 def check_if_module_is_imported(module_name):
 
+    if module_name in sys.modules:
+        return
+
     if find_spec(module_name) is None:
 
         raise ModuleNotFoundError(f"{module_name} not found - use "
                                   f"'pip install rivet_transpiler[{module_name}]'")
 
 
+# Lazy Imports - bqskit and pytket are optional and slow to import,
+# so defer loading them until a stack actually needs them
+
+_BQSKIT = None
+_PYTKET = None
+
+
+def get_bqskit():
+
+    global _BQSKIT
+
+    if _BQSKIT is None:
+
+        check_if_module_is_imported('bqskit')
+
+        import bqskit
+        import bqskit.ext
+
+        _BQSKIT = bqskit
+
+    return _BQSKIT
+
+
+def get_pytket():
+
+    global _PYTKET
+
+    if _PYTKET is None:
+
+        check_if_module_is_imported('pytket')
+
+        import pytket
+        import pytket.extensions.qiskit
+
+        _PYTKET = pytket
+
+    return _PYTKET
+
+
 # 1) Get Stack Pass Manager
 
 def get_stack_pass_manager(stack="qiskit", **key_arguments):
@@ -108,11 +141,46 @@ def get_stack_pass_manager(stack="qiskit", **key_arguments):
 
 # 2) Model From IBMQ Backend
 
+# IBMQ to BQSKit gate mapping - built once, lazily, since bqskit is optional
+
+_IBMQ_TO_BQSKIT_GATES = None
+
+
+def get_ibmq_to_bqskit_gates():
+
+    global _IBMQ_TO_BQSKIT_GATES
+
+    if _IBMQ_TO_BQSKIT_GATES is None:
+
+        bqskit = get_bqskit()
+
+        _IBMQ_TO_BQSKIT_GATES = {'cx': bqskit.ir.gates.CNOTGate(),
+                                 'cz': bqskit.ir.gates.CZGate(),
+                                 'u3': bqskit.ir.gates.U3Gate(),
+                                 'u2': bqskit.ir.gates.U2Gate(),
+                                 'u1': bqskit.ir.gates.U1Gate(),
+                                 'rz': bqskit.ir.gates.RZGate(),
+                                 'sx': bqskit.ir.gates.SXGate(),
+                                 'x': bqskit.ir.gates.XGate(),
+                                 'p': bqskit.ir.gates.RZGate()}
+
+    return _IBMQ_TO_BQSKIT_GATES
+
+
+# Machine Model Cache - keyed by backend identity, the backend reference
+# in the value keeps the id from being reused by a new object
+
+_MACHINE_MODEL_CACHE = {}
+
+
 def model_from_ibmq_backend(backend):
 
     """
     Create a machine model from an IBMQ backend.
 
+    The model is cached per backend - repeated pass construction for the
+    same backend does not rebuild it.
+
     Args:
         backend: The IBMQ backend.
 
@@ -120,20 +188,25 @@ def model_from_ibmq_backend(backend):
         MachineModel: The machine model representing the backend.
     """
 
+    bqskit = get_bqskit()
+
+    # Cached Model
+
+    cache_entry = _MACHINE_MODEL_CACHE.get(id(backend))
+
+    if cache_entry is not None:
+
+        cached_backend, machine_model = cache_entry
+
+        return machine_model
+
     # Basis Gates
     # Based on https://github.com/BQSKit/bqskit/blob/main/bqskit/ext/qiskit/models.py
 
     IBMQ_BASIS_GATES_LIMIT = 10
 
-    IBMQ_TO_BQSKIT_GATES = {'cx': bqskit.ir.gates.CNOTGate(),
-                            'cz': bqskit.ir.gates.CZGate(),
-                            'u3': bqskit.ir.gates.U3Gate(),
-                            'u2': bqskit.ir.gates.U2Gate(),
-                            'u1': bqskit.ir.gates.U1Gate(),
-                            'rz': bqskit.ir.gates.RZGate(),
-                            'sx': bqskit.ir.gates.SXGate(),
-                            'x': bqskit.ir.gates.XGate(),
-                            'p': bqskit.ir.gates.RZGate()}
+    IBMQ_TO_BQSKIT_GATES = get_ibmq_to_bqskit_gates()
+
     # Backend
 
     if backend is None:
@@ -169,8 +242,9 @@ def model_from_ibmq_backend(backend):
                     bqskit.ir.gates.SXGate()}
     else:
 
-        gate_set = {IBMQ_TO_BQSKIT_GATES.get(basis_gate)
-                    for basis_gate in basis_gates} - {None}
+        gate_set = {IBMQ_TO_BQSKIT_GATES[basis_gate]
+                    for basis_gate in basis_gates
+                    if basis_gate in IBMQ_TO_BQSKIT_GATES}
 
     # Coupling List
 
@@ -178,17 +252,44 @@ def model_from_ibmq_backend(backend):
 
     if coupling_map is not None:
 
-        coupling_list = list({tuple(sorted(edge)) for edge in coupling_map})
+        # Deduplicate directed edges without sorting each one
+
+        unique_edges = {frozenset(edge) for edge in coupling_map}
+
+        coupling_list = sorted(tuple(sorted(edge)) for edge in unique_edges)
 
     # Mashine Model
 
     machine_model = bqskit.MachineModel(qubits_count, coupling_list, gate_set)
 
+    _MACHINE_MODEL_CACHE[id(backend)] = (backend, machine_model)
+
     return machine_model
 
 
 # 3) QSearch
 
+# Shared BQSKit Compiler - spinning the worker pool up and down per call
+# dominates small synthesis tasks, so keep one alive for the process
+
+_COMPILER = None
+
+
+def get_compiler():
+
+    global _COMPILER
+
+    if _COMPILER is None:
+
+        bqskit = get_bqskit()
+
+        _COMPILER = bqskit.compiler.Compiler(num_workers=os.cpu_count())
+
+        atexit.register(_COMPILER.close)
+
+    return _COMPILER
+
+
 # 3.1) Run QSearch Synthesis
 
 def run_qsearch_synthesis(bqskit_circuit, machine_model, block_size):
@@ -205,6 +306,8 @@ def run_qsearch_synthesis(bqskit_circuit, machine_model, block_size):
         bqskit.Circuit: The synthesized BQSKit circuit.
     """
 
+    bqskit = get_bqskit()
+
     # Minimal Compilation Task
     # compilation_task = bqskit.compiler.CompilationTask(bqskit_circuit,
     #                                                    [bqskit.passes.QSearchSynthesisPass()])
@@ -219,8 +322,9 @@ def run_qsearch_synthesis(bqskit_circuit, machine_model, block_size):
         bqskit.passes.UnfoldPass()
     ])
 
-    with bqskit.compiler.Compiler() as compiler:
-        synthesized_circuit = compiler.compile(compilation_task)
+    compiler = get_compiler()
+
+    synthesized_circuit = compiler.compile(compilation_task)
 
     # print("bqskit_circuit.gate_counts:", bqskit_circuit.gate_counts)
     # print("synthesized_circuit.gate_counts:", synthesized_circuit.gate_counts)
@@ -230,6 +334,13 @@ def run_qsearch_synthesis(bqskit_circuit, machine_model, block_size):
 
 # 3.2) QSearch Pass
 
+# Synthesized circuits are small but a long sweep of distinct circuits
+# would accumulate indefinitely - cap the caches like the pass manager
+# cache in transpiler.py
+
+_SYNTHESIS_CACHE_SIZE = 256
+
+
 class QSearchPass(qiskit.transpiler.basepasses.TransformationPass):
 
     """
@@ -240,6 +351,10 @@ class QSearchPass(qiskit.transpiler.basepasses.TransformationPass):
         qsearch_block_size: The block size for QSearch synthesis (default is 2).
     """
 
+    __slots__ = ('machine_model', 'qsearch_block_size')
+
+    _synthesis_cache = {}
+
     def __init__(self, backend, qsearch_block_size=None):
 
         check_if_module_is_imported('bqskit')
@@ -256,23 +371,35 @@ class QSearchPass(qiskit.transpiler.basepasses.TransformationPass):
 
         # print("Running QSearchPass")
 
-        qiskit_circuit = qiskit.converters.dag_to_circuit(dag)
+        bqskit = get_bqskit()
+
+        qiskit_circuit = qiskit.converters.dag_to_circuit(dag, copy_operations=False)
+
+        # Synthesis Cache
 
-        qiskit_qasm = dumps(qiskit_circuit)
+        cache_key = (get_circuit_hash(qiskit_circuit),
+                     id(self.machine_model),
+                     self.qsearch_block_size)
 
-        bqskit_qasm_converter = bqskit.ir.lang.qasm2.OPENQASM2Language()
+        synthesized_circuit = QSearchPass._synthesis_cache.get(cache_key)
 
-        bqskit_circuit = bqskit_qasm_converter.decode(qiskit_qasm)
+        if synthesized_circuit is None:
 
-        synthesized_circuit = run_qsearch_synthesis(bqskit_circuit,
-                                                    self.machine_model,
-                                                    self.qsearch_block_size)
+            bqskit_circuit = bqskit.ext.qiskit_to_bqskit(qiskit_circuit)
 
-        synthesized_qasm = bqskit_qasm_converter.encode(synthesized_circuit)
+            synthesized_circuit = run_qsearch_synthesis(bqskit_circuit,
+                                                        self.machine_model,
+                                                        self.qsearch_block_size)
 
-        new_qiskit_circuit = qiskit.QuantumCircuit.from_qasm_str(synthesized_qasm)
+            if len(QSearchPass._synthesis_cache) >= _SYNTHESIS_CACHE_SIZE:
 
-        new_dag = qiskit.converters.circuit_to_dag(new_qiskit_circuit)
+                QSearchPass._synthesis_cache.clear()
+
+            QSearchPass._synthesis_cache[cache_key] = synthesized_circuit
+
+        new_qiskit_circuit = bqskit.ext.bqskit_to_qiskit(synthesized_circuit)
+
+        new_dag = qiskit.converters.circuit_to_dag(new_qiskit_circuit, copy_operations=False)
 
         return new_dag
 
@@ -291,6 +418,10 @@ class QFactorPass(qiskit.transpiler.basepasses.TransformationPass):
         qsearch_block_size: The block size for QSearch synthesis (default is 2).
     """
 
+    __slots__ = ('machine_model', 'qsearch_block_size')
+
+    _synthesis_cache = {}
+
     def __init__(self, backend, qsearch_block_size=None):
 
         check_if_module_is_imported('bqskit')
@@ -307,55 +438,87 @@ class QFactorPass(qiskit.transpiler.basepasses.TransformationPass):
 
         # print("Running QFactorPass")
 
-        qiskit_circuit = qiskit.converters.dag_to_circuit(dag)
+        bqskit = get_bqskit()
+
+        qiskit_circuit = qiskit.converters.dag_to_circuit(dag, copy_operations=False)
+
+        # Synthesis Cache
+
+        cache_key = (get_circuit_hash(qiskit_circuit),
+                     id(self.machine_model),
+                     self.qsearch_block_size)
+
+        synthesized_circuit = QFactorPass._synthesis_cache.get(cache_key)
+
+        if synthesized_circuit is None:
+
+            bqskit_circuit = bqskit.ext.qiskit_to_bqskit(qiskit_circuit)
+
+            # Ansatz
+
+            qubits_count = bqskit_circuit.num_qudits
+
+            qubit_pairs = list(itertools.combinations(range(qubits_count), 2))
 
-        qiskit_qasm = dumps(qiskit_circuit)
+            # Connected pairs first - QFactor converges in fewer iterations
+            # when the early ansatz layers already respect the topology
 
-        bqskit_qasm_converter = bqskit.ir.lang.qasm2.OPENQASM2Language()
+            if self.machine_model.num_qudits >= qubits_count:
 
-        bqskit_circuit = bqskit_qasm_converter.decode(qiskit_qasm)
+                # Rebuild from the edge list - the CouplingGraph copy
+                # constructor skips the distance matrix
 
-        # Ansatz
+                coupling_graph = bqskit.qis.graph.CouplingGraph(
+                    list(self.machine_model.coupling_graph),
+                    self.machine_model.num_qudits)
 
-        qubits_count = bqskit_circuit.num_qudits
+                distances = coupling_graph.all_pairs_shortest_path()
 
-        qubit_pairs = np.transpose(np.triu_indices(qubits_count, 1))
+                qubit_pairs.sort(key=lambda pair: distances[pair[0]][pair[1]])
 
-        ansatz_circuit = bqskit.ir.circuit.Circuit(qubits_count)
+            ansatz_circuit = bqskit.ir.circuit.Circuit(qubits_count)
 
-        for qubit_pair in qubit_pairs:
+            # BQSKit gates are stateless - one instance serves every location
 
-            ansatz_circuit.append_gate(bqskit.ir.gates.VariableUnitaryGate(num_qudits=2),
-                                       location=qubit_pair)
+            variable_unitary_gate = bqskit.ir.gates.VariableUnitaryGate(num_qudits=2)
 
-        # QFactor Optimization
+            for qubit_pair in qubit_pairs:
 
-        target = bqskit_circuit.get_unitary()
+                ansatz_circuit.append_gate(variable_unitary_gate,
+                                           location=qubit_pair)
 
-        instantiated_circuit = ansatz_circuit.copy()
+            # QFactor Optimization
 
-        instantiated_circuit.instantiate(
-            target=target,
-            method='qfactor',
-            diff_tol_a=1e-12,   # Stopping criteria for distance change
-            diff_tol_r=1e-6,    # Relative criteria for distance change
-            dist_tol=1e-12,     # Stopping criteria for distance
-            max_iters=100000,   # Maximum number of iterations
-            min_iters=1000,     # Minimum number of iterations
-            slowdown_factor=0,  # Larger numbers slowdown optimization to avoid local minima
-        )
+            target = bqskit_circuit.get_unitary()
 
-        # QSearch Synthesis
+            instantiated_circuit = ansatz_circuit.copy()
 
-        synthesized_circuit = run_qsearch_synthesis(instantiated_circuit,
-                                                    self.machine_model,
-                                                    self.qsearch_block_size)
+            instantiated_circuit.instantiate(
+                target=target,
+                method='qfactor',
+                diff_tol_a=1e-12,   # Stopping criteria for distance change
+                diff_tol_r=1e-6,    # Relative criteria for distance change
+                dist_tol=1e-12,     # Stopping criteria for distance
+                max_iters=100000,   # Maximum number of iterations
+                min_iters=1000,     # Minimum number of iterations
+                slowdown_factor=0,  # Larger numbers slowdown optimization to avoid local minima
+            )
 
-        synthesized_qasm = bqskit_qasm_converter.encode(synthesized_circuit)
+            # QSearch Synthesis
 
-        new_qiskit_circuit = qiskit.QuantumCircuit.from_qasm_str(synthesized_qasm)
+            synthesized_circuit = run_qsearch_synthesis(instantiated_circuit,
+                                                        self.machine_model,
+                                                        self.qsearch_block_size)
 
-        new_dag = qiskit.converters.circuit_to_dag(new_qiskit_circuit)
+            if len(QFactorPass._synthesis_cache) >= _SYNTHESIS_CACHE_SIZE:
+
+                QFactorPass._synthesis_cache.clear()
+
+            QFactorPass._synthesis_cache[cache_key] = synthesized_circuit
+
+        new_qiskit_circuit = bqskit.ext.bqskit_to_qiskit(synthesized_circuit)
+
+        new_dag = qiskit.converters.circuit_to_dag(new_qiskit_circuit, copy_operations=False)
 
         return new_dag
 
@@ -375,9 +538,11 @@ class PytketPass(qiskit.transpiler.basepasses.TransformationPass):
         pytket_backend: The Pytket backend.
     """
 
+    __slots__ = ('pytket_backend', 'compilation_pass', 'rebase_pass')
+
     def __init__(self, backend=None):
 
-        check_if_module_is_imported('pytket')
+        pytket = get_pytket()
 
         # Noise Model
 
@@ -399,36 +564,41 @@ class PytketPass(qiskit.transpiler.basepasses.TransformationPass):
 
         self.pytket_backend = pytket_backend
 
+        # Pytket passes are stateless - build them once per pass instance
+
+        self.compilation_pass = pytket_backend.default_compilation_pass(
+            optimisation_level=2)
+
+        IBMQ_GATES = {pytket.OpType.CX,
+                      pytket.OpType.Rz,
+                      pytket.OpType.SX,
+                      pytket.OpType.X}
+
+        self.rebase_pass = pytket.passes.SequencePass([
+            pytket.passes.FullPeepholeOptimise(),
+            pytket.passes.auto_rebase_pass(gateset=IBMQ_GATES)
+        ])
+
     def run(self, dag):
 
         # print("Running PytketPass")
 
-        qiskit_circuit = qiskit.converters.dag_to_circuit(dag)
+        pytket = get_pytket()
+
+        qiskit_circuit = qiskit.converters.dag_to_circuit(dag, copy_operations=False)
 
         pytket_circuit = pytket.extensions.qiskit.qiskit_to_tk(qiskit_circuit)
 
         # Compilation
 
-        compilation_pass = self.pytket_backend.default_compilation_pass(optimisation_level=2)
-
-        compilation_pass.apply(pytket_circuit)
+        self.compilation_pass.apply(pytket_circuit)
 
         # Rebase
 
-        IBMQ_GATES = {pytket.OpType.CX,
-                      pytket.OpType.Rz,
-                      pytket.OpType.SX,
-                      pytket.OpType.X}
-
-        rebase_pass = pytket.passes.SequencePass([
-            pytket.passes.FullPeepholeOptimise(),
-            pytket.passes.auto_rebase_pass(gateset=IBMQ_GATES)
-        ])
-
-        rebase_pass.apply(pytket_circuit)
+        self.rebase_pass.apply(pytket_circuit)
 
         transpiled_qiskit_circuit = pytket.extensions.qiskit.tk_to_qiskit(pytket_circuit)
 
-        new_dag = qiskit.converters.circuit_to_dag(transpiled_qiskit_circuit)
+        new_dag = qiskit.converters.circuit_to_dag(transpiled_qiskit_circuit, copy_operations=False)
 
         return new_dag
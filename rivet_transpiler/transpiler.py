@@ -1,5 +1,15 @@
 """ Rivet Transpiler functions. """
 
+import multiprocessing
+import threading
+import weakref
+
+from collections import namedtuple
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 import qiskit
 
 from rivet_transpiler.stacks import get_stack_pass_manager
@@ -7,6 +17,175 @@ from rivet_transpiler.stacks import get_stack_pass_manager
 from rivet_transpiler.dynamical_decoupling import add_dynamical_decoupling
 
 
+# Transpile Options - a named tuple is lighter than a dict and gives
+# attribute access; string indexing is kept for existing callers
+
+class TranspileOptions(namedtuple('TranspileOptions',
+                                  ['backend',
+                                   'key_arguments',
+                                   'pass_manager',
+                                   'original_circuit'])):
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+
+        if isinstance(key, str):
+
+            return getattr(self, key)
+
+        return super().__getitem__(key)
+
+
+# Pass Manager Cache - building a preset pass manager is expensive and
+# transpile_chain / transpile_right / transpile_left repeat it with the
+# same backend and options; the backend reference in the value keeps the
+# id from being reused by a new object
+
+_PASS_MANAGER_CACHE = {}
+
+_PASS_MANAGER_CACHE_SIZE = 32
+
+# Qiskit's BasisTranslator temporarily mutates the shared session
+# equivalence library, so pass-manager runs must not interleave across
+# threads; uncontended acquisition costs nothing single-threaded
+
+_PASS_MANAGER_RUN_LOCK = threading.Lock()
+
+
+def get_cached_pass_manager(parameters):
+
+    """
+    Get a stack pass manager, reusing a cached one when possible.
+
+    Parameters are frozen into a hashable cache key; lists are converted
+    to tuples. Calls with unhashable arguments (nested lists, custom
+    objects without hashing) fall back to building an uncached manager.
+
+    Args:
+        parameters (dict): Keyword arguments for get_stack_pass_manager,
+                           including 'backend'.
+
+    Returns:
+        PassManager: The stack pass manager.
+    """
+
+    backend = parameters.get('backend')
+
+    try:
+
+        frozen_arguments = tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in parameters.items()
+            if name != 'backend'))
+
+        # Pass managers carry per-run state, so never share one between
+        # threads - key the cache on the calling thread as well
+
+        cache_key = (threading.get_ident(), id(backend), frozen_arguments)
+
+        hash(cache_key)
+
+    except TypeError:
+
+        return get_stack_pass_manager(**parameters)
+
+    cache_entry = _PASS_MANAGER_CACHE.get(cache_key)
+
+    if cache_entry is None:
+
+        if len(_PASS_MANAGER_CACHE) >= _PASS_MANAGER_CACHE_SIZE:
+
+            _PASS_MANAGER_CACHE.clear()
+
+        cache_entry = (backend, get_stack_pass_manager(**parameters))
+
+        _PASS_MANAGER_CACHE[cache_key] = cache_entry
+
+    cached_backend, pass_manager = cache_entry
+
+    return pass_manager
+
+
+# Keyword arguments which keep the trivial-backend fast path valid
+
+_FAST_PATH_ARGUMENTS = {'backend', 'stack', 'seed_transpiler'}
+
+
+def is_trivial_backend(backend):
+
+    """
+    Check whether a backend imposes no coupling or basis constraints.
+
+    True for no backend at all and for an AerSimulator without a
+    coupling map - the type is checked by name so qiskit-aer stays an
+    optional dependency.
+
+    Args:
+        backend: The target backend, or None.
+
+    Returns:
+        bool: Whether transpilation can be skipped for the backend.
+    """
+
+    if backend is None:
+
+        return True
+
+    if type(backend).__name__ != 'AerSimulator':
+
+        return False
+
+    return backend.configuration().coupling_map is None
+
+
+# Non-gate operations always accepted by the fast path
+
+_DIRECTIVE_OPERATIONS = {'barrier', 'measure', 'reset', 'delay'}
+
+_STANDARD_GATE_NAMES = None
+
+
+def get_standard_gate_names():
+
+    global _STANDARD_GATE_NAMES
+
+    if _STANDARD_GATE_NAMES is None:
+
+        from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
+
+        _STANDARD_GATE_NAMES = set(get_standard_gate_name_mapping())
+
+    return _STANDARD_GATE_NAMES
+
+
+def is_circuit_supported(circuit, backend):
+
+    """
+    Check whether every circuit operation is native to the backend.
+
+    Custom or composite instructions still need basis translation even
+    on an unconstrained simulator, so they disqualify the fast path.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+        backend: The target backend, or None for the standard gate set.
+
+    Returns:
+        bool: Whether the circuit can be run as-is.
+    """
+
+    if backend is None:
+        supported_names = get_standard_gate_names()
+
+    else:
+        supported_names = set(backend.configuration().basis_gates)
+
+    return all(instruction.operation.name in supported_names or
+               instruction.operation.name in _DIRECTIVE_OPERATIONS
+               for instruction in circuit.data)
+
+
 def transpile(circuit, backend=None, **key_arguments):
 
     """
@@ -55,15 +234,40 @@ def transpile(circuit, backend=None, **key_arguments):
     dd_pulse_alignment = parameters.pop('dd_pulse_alignment', None)
     dynamical_decoupling = parameters.pop('dynamical_decoupling', None)
 
-    # Pass Manager
+    # Fast Path - an unconstrained simulator leaves nothing for the
+    # preset pass manager to do
 
-    stack_pass_manager = get_stack_pass_manager(**parameters)
+    fast_path = (parameters_pass_manager is None and
+                 callback is None and
+                 parameters.get('stack', 'qiskit') == 'qiskit' and
+                 set(parameters) <= _FAST_PATH_ARGUMENTS and
+                 is_trivial_backend(backend) and
+                 is_circuit_supported(circuit, backend))
 
-    pass_manager = parameters_pass_manager or stack_pass_manager
+    if fast_path:
 
-    # Transpile
+        pass_manager = None
+
+        transpiled_circuit = circuit.copy()
+
+    else:
 
-    transpiled_circuit = pass_manager.run(circuit, callback=callback)
+        # Pass Manager - only build a stack pass manager when the caller
+        # did not supply one; it would be discarded otherwise
+
+        if parameters_pass_manager is not None:
+
+            pass_manager = parameters_pass_manager
+
+        else:
+
+            pass_manager = get_cached_pass_manager(parameters)
+
+        # Transpile
+
+        with _PASS_MANAGER_RUN_LOCK:
+
+            transpiled_circuit = pass_manager.run(circuit, callback=callback)
 
     # Dynamical Decoupling
 
@@ -76,12 +280,11 @@ def transpile(circuit, backend=None, **key_arguments):
 
     if return_options is True:
 
-        options = dict()
-
-        options['backend'] = backend
-        options['key_arguments'] = key_arguments
-        options['pass_manager'] = pass_manager
-        options['original_circuit'] = circuit
+        options = TranspileOptions(
+            backend=backend,
+            key_arguments=key_arguments,
+            pass_manager=pass_manager,
+            original_circuit=circuit)
 
         return transpiled_circuit, options
 
@@ -98,27 +301,80 @@ def transpile_chain(circuits, backend=None, **key_arguments):
     Args:
         circuits (list of QuantumCircuit): List of input quantum circuits.
         backend: The target backend for transpilation.
+        parallel (bool): Transpile the circuits concurrently in worker
+                         processes instead of threading the qubit
+                         allocation from one circuit to the next. Only
+                         valid when the circuits are independent of the
+                         shared allocation; the circuits, backend and
+                         keyword arguments must be picklable.
         **key_arguments: Additional keyword arguments for transpilation.
 
     Returns:
         QuantumCircuit: The transpiled chain circuit.
     """
 
+    parallel = key_arguments.pop('parallel', False)
+
     # Transpile
 
-    transpiled_circuits = []
+    if parallel is True:
+
+        # Worker processes sidestep the equivalence-library race which
+        # forces in-process pass manager runs to serialize, so the
+        # links genuinely transpile concurrently. Spawned (not forked)
+        # workers stay safe after Aer or bqskit have started threads in
+        # the parent. Chains like [circuit] * n repeat the same object
+        # - transpile each distinct circuit once and fan the result
+        # back out
+
+        spawn_context = multiprocessing.get_context('spawn')
+
+        with ProcessPoolExecutor(mp_context=spawn_context) as executor:
+
+            futures = {}
+
+            for circuit in circuits:
+
+                if id(circuit) not in futures:
+
+                    futures[id(circuit)] = executor.submit(
+                        transpile, circuit, backend, **key_arguments)
+
+            transpiled_circuits = [futures[id(circuit)].result()
+                                   for circuit in circuits]
+
+    else:
+
+        transpiled_circuits = []
+
+        # Sequential links see a different initial layout each step, so
+        # a repeated circuit is only reused once its layout reaches a
+        # fixed point - the common case for [circuit] * n chains
+
+        chain_cache = {}
+
+        for circuit in circuits:
+
+            initial_layout = key_arguments.get('initial_layout')
+
+            cache_key = (id(circuit),
+                         None if initial_layout is None
+                         else tuple(initial_layout))
 
-    for circuit in circuits:
+            transpiled_circuit = chain_cache.get(cache_key)
 
-        transpiled_circuit = transpile(circuit, backend, **key_arguments)
+            if transpiled_circuit is None:
 
-        full_map = get_full_map(transpiled_circuit)
+                transpiled_circuit = transpile(circuit, backend,
+                                               **key_arguments)
 
-        initial_layout = full_map[:circuit.num_qubits]
+                chain_cache[cache_key] = transpiled_circuit
 
-        key_arguments['initial_layout'] = initial_layout
+            full_map = get_full_map(transpiled_circuit)
 
-        transpiled_circuits.append(transpiled_circuit)
+            key_arguments['initial_layout'] = list(full_map[:circuit.num_qubits])
+
+            transpiled_circuits.append(transpiled_circuit)
 
     # Resulting Circuit
 
@@ -133,13 +389,13 @@ def transpile_chain(circuits, backend=None, **key_arguments):
 
         resulting_circuit.compose(transpiled_circuit, inplace=True)
 
-    resulting_circuit._layout = transpiled_circuit.layout
+    resulting_circuit._layout = transpiled_circuits[-1].layout
 
     return resulting_circuit
 
 
 def transpile_right(central_circuit, right_circuit,
-                    backend=None, **key_arguments):
+                    backend=None, inplace=False, **key_arguments):
 
     """
     Transpile a right quantum circuit and combine it with already transpiled central circuit.
@@ -148,6 +404,10 @@ def transpile_right(central_circuit, right_circuit,
         central_circuit (QuantumCircuit): The central quantum circuit.
         right_circuit (QuantumCircuit): The right quantum circuit to transpile and add.
         backend: The target backend for transpilation.
+        inplace (bool): Compose into the central circuit instead of
+                        copying it into a fresh one. Only safe when the
+                        caller owns the central circuit - e.g. an
+                        accumulator in a composition loop.
         **key_arguments: Additional keyword arguments for transpilation.
 
     Returns:
@@ -158,7 +418,7 @@ def transpile_right(central_circuit, right_circuit,
 
     full_map = get_full_map(central_circuit)
 
-    key_arguments['initial_layout'] = full_map[:right_circuit.num_qubits]
+    key_arguments['initial_layout'] = list(full_map[:right_circuit.num_qubits])
 
     transpiled_right_circuit = transpile(
         right_circuit,
@@ -170,54 +430,69 @@ def transpile_right(central_circuit, right_circuit,
     resulting_qubits_count = max(central_circuit.num_qubits,
                                  transpiled_right_circuit.num_qubits)
 
-    resulting_circuit = qiskit.QuantumCircuit(resulting_qubits_count)
+    if inplace is True and central_circuit.num_qubits == resulting_qubits_count:
+
+        resulting_circuit = central_circuit
+
+        resulting_circuit.compose(transpiled_right_circuit, inplace=True)
 
-    resulting_circuit.compose(central_circuit, inplace=True)
-    resulting_circuit.compose(transpiled_right_circuit, inplace=True)
+    else:
+
+        resulting_circuit = qiskit.QuantumCircuit(resulting_qubits_count)
+
+        resulting_circuit.compose(central_circuit, inplace=True)
+        resulting_circuit.compose(transpiled_right_circuit, inplace=True)
 
     # No Layout
 
-    if transpiled_right_circuit.layout is None:
+    central_layout = central_circuit.layout
+    right_layout = transpiled_right_circuit.layout
+
+    if right_layout is None:
 
         return resulting_circuit
 
-    if central_circuit.layout is None:
+    if central_layout is None:
 
-        resulting_circuit._layout = transpiled_right_circuit.layout
+        resulting_circuit._layout = right_layout
 
         return resulting_circuit
 
     # Central Routing
 
-    if central_circuit.layout.final_layout is None:
+    if central_layout.final_layout is None:
 
         central_routing = list(range(central_circuit.num_qubits))
 
     else:
-        central_routing = [central_circuit.layout.final_layout[qubit]
-                           for qubit in central_circuit.qubits]
+        central_v2p = central_layout.final_layout.get_virtual_bits()
+
+        central_routing = list(map(central_v2p.__getitem__,
+                                   central_circuit.qubits))
 
     # Right Routing
 
-    if transpiled_right_circuit.layout.final_layout is None:
+    if right_layout.final_layout is None:
 
         right_routing = list(range(resulting_qubits_count))
 
     else:
-        right_routing = [transpiled_right_circuit.layout.final_layout[qubit]
-                         for qubit in transpiled_right_circuit.qubits]
+        right_v2p = right_layout.final_layout.get_virtual_bits()
+
+        right_routing = list(map(right_v2p.__getitem__,
+                                 transpiled_right_circuit.qubits))
 
     # Final Routing
 
-    final_routing = [right_routing[qubit] for qubit in central_routing]
+    final_routing = list(map(right_routing.__getitem__, central_routing))
 
     # Layouts
 
-    final_layout = qiskit.transpiler.Layout.from_intlist(final_routing, *resulting_circuit.qregs)
+    final_layout = get_layout_from_intlist(final_routing, resulting_circuit.qregs)
 
     transpile_layout = qiskit.transpiler.TranspileLayout(
-        input_qubit_mapping=central_circuit.layout.input_qubit_mapping,
-        initial_layout=central_circuit.layout.initial_layout,
+        input_qubit_mapping=central_layout.input_qubit_mapping,
+        initial_layout=central_layout.initial_layout,
         final_layout=final_layout
     )
 
@@ -226,6 +501,69 @@ def transpile_right(central_circuit, right_circuit,
     return resulting_circuit
 
 
+def get_layout_from_intlist(routing, registers):
+
+    """
+    Build a Layout mapping virtual qubit i to physical qubit routing[i].
+
+    Equivalent to qiskit.transpiler.Layout.from_intlist but populates
+    the internal maps directly, skipping the per-qubit validation that
+    dominates layout construction in composition loops.
+
+    Args:
+        routing (list of int): Physical qubit per virtual qubit index.
+        registers (list of QuantumRegister): Registers supplying the
+                                             virtual qubits, in order.
+
+    Returns:
+        Layout: The constructed layout.
+    """
+
+    qubits = [qubit for register in registers for qubit in register]
+
+    layout = qiskit.transpiler.Layout()
+
+    layout._v2p = dict(zip(qubits, routing))
+    layout._p2v = dict(zip(routing, qubits))
+
+    layout._regs = list(registers)
+
+    return layout
+
+
+# Inverse Cache - left-composition loops invert the same left circuit
+# repeatedly; QuantumCircuit is unhashable, so key by id and let a weak
+# reference drop the entry when the circuit is collected
+
+_INVERSE_CACHE = {}
+
+
+def get_inverse_circuit(circuit):
+
+    cache_entry = _INVERSE_CACHE.get(id(circuit))
+
+    if cache_entry is not None:
+
+        circuit_reference, inverse_circuit = cache_entry
+
+        if circuit_reference() is circuit:
+
+            return inverse_circuit
+
+    cache_key = id(circuit)
+
+    circuit_reference = weakref.ref(
+        circuit,
+        lambda reference, cache_key=cache_key:
+            _INVERSE_CACHE.pop(cache_key, None))
+
+    inverse_circuit = circuit.inverse()
+
+    _INVERSE_CACHE[cache_key] = (circuit_reference, inverse_circuit)
+
+    return inverse_circuit
+
+
 def transpile_left(central_circuit, left_circuit,
                    backend=None, **key_arguments):
 
@@ -244,14 +582,16 @@ def transpile_left(central_circuit, left_circuit,
 
     # Left Initial Layout
 
-    if central_circuit.layout is None:
+    central_layout = central_circuit.layout
+
+    if central_layout is None:
 
         left_initial_layout = list(range(left_circuit.num_qubits))
 
     else:
 
-        initial_layout = central_circuit.layout.initial_layout
-        input_qubit_mapping = central_circuit.layout.input_qubit_mapping
+        initial_layout = central_layout.initial_layout
+        input_qubit_mapping = central_layout.input_qubit_mapping
 
         initial_map = [initial_layout[qubit] for qubit in input_qubit_mapping]
 
@@ -261,7 +601,7 @@ def transpile_left(central_circuit, left_circuit,
 
     key_arguments['initial_layout'] = left_initial_layout
 
-    inverted_left_circuit = left_circuit.inverse()
+    inverted_left_circuit = get_inverse_circuit(left_circuit)
 
     transpiled_inverted_left_circuit = transpile(
         inverted_left_circuit,
@@ -284,50 +624,67 @@ def transpile_left(central_circuit, left_circuit,
 
     # No Layout
 
-    if transpiled_left_circuit.layout is None:
+    left_layout = transpiled_left_circuit.layout
+
+    if left_layout is None:
 
         return resulting_circuit
 
     # Left Routing
 
-    if transpiled_left_circuit.layout.final_layout is None:
+    if left_layout.final_layout is None:
 
         left_routing = list(range(transpiled_left_circuit.num_qubits))
 
     else:
-        left_routing = [transpiled_left_circuit.layout.final_layout[qubit]
-                        for qubit in transpiled_left_circuit.qubits]
+        left_v2p = left_layout.final_layout.get_virtual_bits()
+
+        left_routing = list(map(left_v2p.__getitem__,
+                                transpiled_left_circuit.qubits))
 
     # Central Routing
 
-    if (central_circuit.layout is None or
-            central_circuit.layout.final_layout is None):
+    if (central_layout is None or
+            central_layout.final_layout is None):
 
         central_routing = list(range(resulting_qubits_count))
 
     else:
-        central_routing = [central_circuit.layout.final_layout[qubit]
-                           for qubit in central_circuit.qubits]
+        central_v2p = central_layout.final_layout.get_virtual_bits()
+
+        central_routing = list(map(central_v2p.__getitem__,
+                                   central_circuit.qubits))
 
     # Final Routing
 
-    final_routing = [central_routing[qubit] for qubit in left_routing]
+    final_routing = list(map(central_routing.__getitem__, left_routing))
 
     # Final Layout
 
-    final_layout = qiskit.transpiler.Layout.from_intlist(final_routing, *resulting_circuit.qregs)
+    final_layout = get_layout_from_intlist(final_routing, resulting_circuit.qregs)
 
     # Initial Layout
 
-    input_qubit_mapping = transpiled_left_circuit.layout.input_qubit_mapping
+    input_qubit_mapping = left_layout.input_qubit_mapping
 
     initial_map = get_full_map(transpiled_left_circuit)
 
-    initial_layout = transpiled_left_circuit.layout.initial_layout.copy()
+    # One dict pass - Layout.copy duplicates both internal maps and
+    # per-item assignment re-validates every override
+
+    source_initial_layout = left_layout.initial_layout
 
-    for virtual, physical in zip(input_qubit_mapping, initial_map):
+    new_v2p = dict(source_initial_layout.get_virtual_bits())
 
-        initial_layout[virtual] = physical
+    new_v2p.update(zip(input_qubit_mapping, initial_map))
+
+    initial_layout = qiskit.transpiler.Layout()
+
+    initial_layout._v2p = new_v2p
+    initial_layout._p2v = {physical: virtual
+                           for virtual, physical in new_v2p.items()}
+
+    initial_layout._regs = list(source_initial_layout._regs)
 
     # Transpile Layout
 
@@ -342,6 +699,178 @@ def transpile_left(central_circuit, left_circuit,
     return resulting_circuit
 
 
+def remove_unused_qubits(circuit):
+
+    """
+    Remove qubits which are not used by any instruction of a circuit.
+
+    Rebuilds quantum registers to contain only used qubits, remaps
+    instructions to the new registers and restricts the transpile layout
+    accordingly - so that `get_full_map` keeps working for the reduced
+    circuit. Typical use is shrinking a transpiled circuit which was
+    padded with backend ancilla qubits.
+
+    Args:
+        circuit (QuantumCircuit): The input quantum circuit.
+
+    Returns:
+        QuantumCircuit: Circuit containing only used qubits.
+    """
+
+    # Used Qubits - single pass over instructions
+
+    seen_qubits = set()
+
+    for instruction in circuit.data:
+
+        for qubit in instruction.qubits:
+
+            seen_qubits.add(qubit)
+
+    used_qubits = [qubit for qubit in circuit.qubits
+                   if qubit in seen_qubits]
+
+    # Fast Path - nothing to remove
+
+    if len(used_qubits) == circuit.num_qubits:
+
+        return circuit
+
+    # Registers - batch the register lookup instead of find_bit per qubit
+
+    qubit_to_registers = dict()
+
+    for register in circuit.qregs:
+
+        for register_index, qubit in enumerate(register):
+
+            qubit_to_registers.setdefault(qubit, []).append(
+                (register, register_index))
+
+    registers = dict()
+
+    for qubit in used_qubits:
+
+        for register, register_index in qubit_to_registers[qubit]:
+
+            registers.setdefault(register, []).append(qubit)
+
+    # New Registers
+
+    qubit_mapping = dict()
+
+    new_registers = []
+
+    for register, register_qubits in registers.items():
+
+        new_register = qiskit.QuantumRegister(len(register_qubits),
+                                              register.name)
+
+        new_registers.append(new_register)
+
+        for new_qubit, qubit in zip(new_register, register_qubits):
+
+            qubit_mapping[qubit] = new_qubit
+
+    # New Circuit
+
+    new_circuit = qiskit.QuantumCircuit(*new_registers, *circuit.cregs,
+                                        name=circuit.name,
+                                        global_phase=circuit.global_phase)
+
+    # Direct construction - instruction.replace would copy the operation
+
+    map_qubit = qubit_mapping.__getitem__
+
+    new_circuit.data = [
+        qiskit.circuit.CircuitInstruction(instruction.operation,
+                                          tuple(map(map_qubit, instruction.qubits)),
+                                          instruction.clbits)
+        for instruction in circuit.data]
+
+    # Layouts
+
+    layout = circuit.layout
+
+    if layout is None:
+
+        return new_circuit
+
+    initial_layout = layout.initial_layout
+    input_qubit_mapping = layout.input_qubit_mapping
+    final_layout = layout.final_layout
+
+    # Physical Mapping - old physical index to new physical index
+
+    qubit_indices = {qubit: index for index, qubit
+                     in enumerate(circuit.qubits)}
+
+    new_qubit_indices = {qubit: index for index, qubit
+                         in enumerate(new_circuit.qubits)}
+
+    physical_mapping = {qubit_indices[qubit]: new_qubit_indices[qubit_mapping[qubit]]
+                        for qubit in used_qubits}
+
+    # Used Input Qubits - sets for O(1) membership tests below
+
+    used_input_qubits = set()
+
+    for physical, input_qubit in initial_layout.get_physical_bits().items():
+
+        if circuit.qubits[physical] in seen_qubits:
+
+            used_input_qubits.add(input_qubit)
+
+    # New Initial Layout
+
+    new_initial_layout = qiskit.transpiler.Layout()
+
+    sorted_initial_layout = sorted(initial_layout.get_physical_bits().items())
+
+    for physical, input_qubit in sorted_initial_layout:
+
+        if input_qubit in used_input_qubits:
+
+            new_initial_layout[input_qubit] = physical_mapping[physical]
+
+    # New Input Qubit Mapping
+
+    new_input_qubit_mapping = dict()
+
+    for input_qubit in sorted(input_qubit_mapping,
+                              key=input_qubit_mapping.get):
+
+        if input_qubit in used_input_qubits:
+
+            new_input_qubit_mapping[input_qubit] = len(new_input_qubit_mapping)
+
+    # New Final Layout
+
+    if final_layout is None:
+
+        new_final_layout = None
+
+    else:
+
+        new_final_layout_dict = {
+            qubit_mapping[qubit]: physical_mapping[final_layout[qubit]]
+            for qubit in used_qubits}
+
+        new_final_layout = qiskit.transpiler.Layout(new_final_layout_dict)
+
+    # Transpile Layout
+
+    transpile_layout = qiskit.transpiler.TranspileLayout(
+        initial_layout=new_initial_layout,
+        input_qubit_mapping=new_input_qubit_mapping,
+        final_layout=new_final_layout
+    )
+
+    new_circuit._layout = transpile_layout
+
+    return new_circuit
+
+
 def get_full_map(transpiled_circuit, verbose=False):
 
     """
@@ -352,73 +881,112 @@ def get_full_map(transpiled_circuit, verbose=False):
         verbose (bool): Whether to print the full map calculation stages.
 
     Returns:
-        list: The full map of qubits.
+        tuple: The full map of qubits.
     """
 
     # No Layout
 
-    if transpiled_circuit.layout is None:
+    layout = transpiled_circuit.layout
 
-        full_map = list(range(transpiled_circuit.num_qubits))
+    if layout is None:
+
+        full_map = tuple(range(transpiled_circuit.num_qubits))
 
         return full_map
 
+    # Cached Map - circuits are not relaid out after transpilation, so
+    # the layout identities key the cache
+
+    layout_key = (id(layout), id(layout.final_layout))
+
+    cache_entry = getattr(transpiled_circuit, '_rivet_full_map', None)
+
+    if cache_entry is not None and verbose is False:
+
+        cached_layout_key, cached_full_map = cache_entry
+
+        if cached_layout_key == layout_key:
+
+            return cached_full_map
+
     # Zero Map
 
-    input_qubit_mapping = transpiled_circuit.layout.input_qubit_mapping
-    initial_layout = transpiled_circuit.layout.initial_layout
-    final_layout = transpiled_circuit.layout.final_layout
+    input_qubit_mapping = layout.input_qubit_mapping
+    initial_layout = layout.initial_layout
+    final_layout = layout.final_layout
 
-    zero_map = dict(zip(input_qubit_mapping,
-                        transpiled_circuit.qubits))
+    qubits = transpiled_circuit.qubits
+    qubits_count = len(qubits)
 
-    # After Layout Map
+    physical_bits = initial_layout.get_physical_bits()
 
-    after_layout_map = [()] * transpiled_circuit.num_qubits
+    # Zero Map - input virtual qubit to output qubit position
 
-    for physical, in_virtual in initial_layout.get_physical_bits().items():
+    zero_positions = {id(in_virtual): position
+                      for position, in_virtual in enumerate(input_qubit_mapping)}
 
-        out_virtual = zero_map[in_virtual]
+    # Identity Fast Path - simulator backends commonly apply no layout
+    # permutation at all
 
-        after_layout_map[physical] = (in_virtual, out_virtual)
+    initial_is_identity = all(
+        zero_positions[id(in_virtual)] == physical
+        for physical, in_virtual in physical_bits.items())
 
-    # After Routing Map
+    final_v2p = None if final_layout is None else final_layout.get_virtual_bits()
 
-    after_routing_map = after_layout_map.copy()
+    if initial_is_identity:
 
-    if final_layout is not None:
+        final_is_identity = final_v2p is None or all(
+            final_v2p[qubit] == position
+            for position, qubit in enumerate(qubits))
+
+        if final_is_identity:
 
-        for from_row, qubit in enumerate(transpiled_circuit.qubits):
+            full_map = tuple(range(qubits_count))
 
-            to_row = final_layout[qubit]
+            transpiled_circuit._rivet_full_map = (layout_key, full_map)
 
-            from_in, from_out = after_layout_map[from_row]
-            to_in, to_out = after_layout_map[to_row]
+            return full_map
 
-            after_routing_map[to_row] = (to_in, from_out)
+    # After Layout Map - output qubit position per physical qubit
 
-    # Full Map
+    after_layout_map = np.empty(qubits_count, dtype=np.int32)
 
-    full_map = []
+    for physical, in_virtual in physical_bits.items():
 
-    for out_qubit in transpiled_circuit.qubits:
+        after_layout_map[physical] = zero_positions[id(in_virtual)]
 
-        for physical, virtuals in enumerate(after_routing_map):
+    # After Routing Map - one vectorized scatter instead of a Python loop
 
-            in_virtual, out_virtual = virtuals
+    after_routing_map = after_layout_map
 
-            if out_virtual is out_qubit:
+    if final_layout is not None:
+
+        to_rows = np.fromiter(map(final_v2p.__getitem__, qubits),
+                              dtype=np.int32,
+                              count=qubits_count)
+
+        after_routing_map = after_layout_map.copy()
+
+        after_routing_map[to_rows] = after_layout_map
 
-                full_map.append(physical)
+    # Full Map - invert the physical-to-position permutation
+
+    full_map_array = np.empty(qubits_count, dtype=np.int32)
+
+    full_map_array[after_routing_map] = np.arange(qubits_count, dtype=np.int32)
+
+    full_map = tuple(full_map_array.tolist())
 
     # Printout
 
     if verbose is True:
 
-        print("zero_map:", zero_map)
         print("after_layout_map:", after_layout_map)
         print("after_routing_map:", after_routing_map)
         print("full_map:", full_map)
-        print("transpiled_circuit.layout:", transpiled_circuit.layout)
+        print("transpiled_circuit.layout:", layout)
+
+    transpiled_circuit._rivet_full_map = (layout_key, full_map)
 
     return full_map
@@ -57,7 +57,39 @@ def backend(request):
     return backend_fixture
 
 
-@pytest.fixture(params=QUBIT_COUNTS)
+@pytest.fixture(scope="session")
+def coupling_map(backend):
+
+    # backend.configuration() rebuilds its dict on every call - derive
+    # the coupling map once per backend
+
+    if backend is None:
+
+        return None
+
+    coupling_list = backend.configuration().coupling_map
+
+    if coupling_list is None:
+
+        return None
+
+    coupling_map = qiskit.transpiler.CouplingMap(couplinglist=coupling_list)
+
+    return coupling_map
+
+
+@pytest.fixture(scope="session")
+def fake_lima_backend():
+
+    # Fake backend construction parses calibration data and builds a
+    # Target - share one read-only instance across the session
+
+    fake_lima_backend = FakeLimaV2()
+
+    return fake_lima_backend
+
+
+@pytest.fixture(scope="session", params=QUBIT_COUNTS)
 def qubits_count(request):
 
     qubits_count = request.param
@@ -65,23 +97,85 @@ def qubits_count(request):
     return qubits_count
 
 
+@pytest.fixture(scope="session")
+def toffoli_circuit():
+
+    toffoli_circuit = qiskit.QuantumCircuit(3)
+
+    toffoli_circuit.ccx(0, 1, 2)
+
+    return toffoli_circuit
+
+
+@pytest.fixture(scope="session")
+def fixed_litmus_circuit():
+
+    # Three-qubit litmus circuit shared by the fixed-value tests,
+    # which only read it
+
+    fixed_litmus_circuit = get_litmus_circuit(qubits_count=3)
+
+    return fixed_litmus_circuit
+
+
+@pytest.fixture(scope="session")
+def session_litmus_circuit(qubits_count):
+
+    session_litmus_circuit = get_litmus_circuit(qubits_count, "Litmus")
+
+    return session_litmus_circuit
+
+
 @pytest.fixture
-def litmus_circuit(qubits_count):
+def litmus_circuit(session_litmus_circuit):
 
-    litmus_circuit = get_litmus_circuit(qubits_count, "Litmus")
+    # Tests may mutate the circuit - hand each one a copy
+
+    litmus_circuit = session_litmus_circuit.copy()
 
     return litmus_circuit
 
 
+@pytest.fixture(scope="session")
+def transpiled_litmus_circuit(session_litmus_circuit, backend):
+
+    # Shared across tests which only read the transpiled circuit -
+    # qiskit.transpile on a fake backend takes seconds per call
+
+    transpiled_litmus_circuit = qiskit.transpile(
+        session_litmus_circuit,
+        backend,
+        seed_transpiler=1234)
+
+    return transpiled_litmus_circuit
+
+
+@pytest.fixture(scope="session")
+def target_transpiled_litmus_circuit(session_litmus_circuit, backend):
+
+    # Target-keyed counterpart of transpiled_litmus_circuit - qiskit
+    # treats target= and backend= differently internally
+
+    target = backend.target if backend else None
+
+    target_transpiled_litmus_circuit = qiskit.transpile(
+        session_litmus_circuit,
+        target=target,
+        seed_transpiler=1234)
+
+    return target_transpiled_litmus_circuit
+
+
 @pytest.fixture
 def bound_litmus_circuit(litmus_circuit):
 
     bound_litmus_circuit = litmus_circuit.copy()
 
-    for index, parameter in enumerate(bound_litmus_circuit.parameters):
+    # One bulk binding - per-parameter calls traverse the circuit each time
 
-        bound_litmus_circuit.assign_parameters(
-            {parameter: index},
-            inplace=True)
+    bound_litmus_circuit.assign_parameters(
+        {parameter: index
+         for index, parameter in enumerate(bound_litmus_circuit.parameters)},
+        inplace=True)
 
     return bound_litmus_circuit
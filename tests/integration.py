@@ -2,6 +2,8 @@
 Module containing functions to build and compare test circuits for integration tests.
 """
 
+from collections import Counter
+
 import qiskit
 
 from qiskit_aer import AerSimulator
@@ -67,7 +69,7 @@ def build_blocks_circuit(circuit_parts, backend, *arguments, **key_arguments):
 
         full_map = get_full_map(transpiled_circuit_part)
 
-        initial_layout = full_map[:circuit_part.num_qubits]
+        initial_layout = list(full_map[:circuit_part.num_qubits])
 
         key_arguments['initial_layout'] = initial_layout
 
@@ -100,10 +102,13 @@ def build_right_circuit(circuit_parts, backend, *arguments, **key_arguments):
 
     for right_circuit in circuit_parts[1:]:
 
+        # The accumulator is locally owned - compose into it directly
+
         transpiled_right_circuit = transpile_right(
             central_circuit=central_circuit,
             right_circuit=right_circuit,
             backend=backend,
+            inplace=True,
             *arguments, **key_arguments
         )
 
@@ -162,34 +167,56 @@ def get_circuits_to_compare(circuit_parts, backend, *arguments, **key_arguments)
     return circuits_to_compare
 
 
-def run_circuits_to_compare(circuits_to_compare, backend, shots_count):
+# One simulator for the whole session - AerSimulator construction
+# initializes backend configuration every call
+
+_DEFAULT_SIMULATOR = None
+
 
-    results = {}
+def get_default_simulator():
 
-    for circuit_name, circuit in circuits_to_compare.items():
+    global _DEFAULT_SIMULATOR
 
-        # Assign Parameters
+    if _DEFAULT_SIMULATOR is None:
 
-        for index, parameter in enumerate(circuit.parameters):
+        _DEFAULT_SIMULATOR = AerSimulator()
+
+    return _DEFAULT_SIMULATOR
+
+
+def run_circuits_to_compare(circuits_to_compare, backend, shots_count):
 
-            circuit.assign_parameters({parameter: index}, inplace=True)
+    if backend is None:
+        run_backend = get_default_simulator()
+    else:
+        run_backend = backend
 
-        # Backend
+    run_circuits = []
+
+    for circuit in circuits_to_compare.values():
+
+        # Assign Parameters - one bulk binding per circuit
+
+        circuit.assign_parameters(
+            {parameter: index
+             for index, parameter in enumerate(circuit.parameters)},
+            inplace=True)
 
         if backend is None:
-            run_backend = AerSimulator()
             run_circuit = transpile(circuit, run_backend)
         else:
-            run_backend = backend
             run_circuit = circuit
 
-        # Run
+        run_circuits.append(run_circuit)
+
+    # Run - a single batched job lets Aer parallelize the experiments
 
-        job = run_backend.run(run_circuit, shots=shots_count)
+    job = run_backend.run(run_circuits, shots=shots_count)
 
-        counts = job.result().get_counts()
+    result = job.result()
 
-        results[circuit_name] = counts
+    results = {circuit_name: result.get_counts(index)
+               for index, circuit_name in enumerate(circuits_to_compare)}
 
     return results
 
@@ -224,17 +251,11 @@ def check_delta(results, delta_treshold=0.1):
 
     # Total Counts
 
-    total_counts = {}
-
-    for circuit_name, counts in results.items():
-
-        for state, count in counts.items():
+    total_counts = Counter()
 
-            if state in total_counts:
-                total_counts[state] += count
+    for counts in results.values():
 
-            else:
-                total_counts[state] = count
+        total_counts.update(counts)
 
     # Average Counts
 
@@ -250,7 +271,7 @@ def check_delta(results, delta_treshold=0.1):
     for circuit_name, counts in results.items():
 
         total_delta = 0
-        total_counts = 0
+        circuit_counts = 0
 
         for state, count in counts.items():
 
@@ -259,11 +280,11 @@ def check_delta(results, delta_treshold=0.1):
             delta = abs(count - average_count)
 
             total_delta += delta
-            total_counts += count
+            circuit_counts += count
 
         # Check Passed
 
-        check_pass_flag = total_delta < delta_treshold * total_counts
+        check_pass_flag = total_delta < delta_treshold * circuit_counts
 
         check_pass_flags.append(check_pass_flag)
 
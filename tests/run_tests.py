@@ -1,15 +1,25 @@
+import os
+
 import pytest
-import coverage
 
+# Coverage's tracer roughly doubles the suite wall time - only pay for
+# it when a report is actually wanted
+
+COVERAGE_ENABLED = os.environ.get("RIVET_COVERAGE") == "1"
+
+if COVERAGE_ENABLED:
 
-cov = coverage.Coverage(
-    source_pkgs=["rivet_transpiler"],
-    omit=[
-        "dynamical_decoupling.py",
-        "transpile_part.py"
-    ])
+    import coverage
 
-cov.start()
+    cov = coverage.Coverage(
+        source_pkgs=["rivet_transpiler"],
+        branch=False,
+        omit=[
+            "dynamical_decoupling.py",
+            "transpile_part.py"
+        ])
+
+    cov.start()
 
 exit_code = pytest.main([
     '--verbosity=2',
@@ -26,11 +36,13 @@ exit_code = pytest.main([
     # 'tests/test_integration.py',
 ])
 
-cov.stop()
-cov.save()
+if COVERAGE_ENABLED:
+
+    cov.stop()
+    cov.save()
 
-cov.report(show_missing=True, skip_empty=True)
+    cov.report(show_missing=True, skip_empty=True)
 
-# cov.html_report(directory='coverage_report_html')
+    # cov.html_report(directory='coverage_report_html')
 
 quit(exit_code)
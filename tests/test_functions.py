@@ -11,28 +11,20 @@ from rivet_transpiler import get_sinusoids
 from rivet_transpiler import get_circuit_hash
 
 
-def test_get_ibm_cost_value():
+def test_get_ibm_cost_value(fixed_litmus_circuit):
 
-    litmus_circuit = get_litmus_circuit(qubits_count=3)
-
-    ibm_cost = get_ibm_cost(litmus_circuit)
+    ibm_cost = get_ibm_cost(fixed_litmus_circuit)
 
     rounded_ibm_cost = round(ibm_cost, 4)
 
     assert rounded_ibm_cost == 0.9499
 
 
-def test_get_ibm_cost_toffoli():
-
-    toffoli_circuit = qiskit.QuantumCircuit(3)
-
-    toffoli_circuit.ccx(0, 1, 2)
+def test_get_ibm_cost_toffoli(toffoli_circuit):
 
     with pytest.raises(ValueError):
 
-        ibm_cost = get_ibm_cost(toffoli_circuit)
-
-        return ibm_cost
+        get_ibm_cost(toffoli_circuit)
 
 
 def test_cnot_circuit(qubits_count):
@@ -85,11 +77,12 @@ def bind_parameters_with_offset(circuit, offset=0):
 
     bound_circuit = circuit.copy()
 
-    for index, parameter in enumerate(bound_circuit.parameters):
+    # One bulk binding - per-parameter calls rescan the parameter table
 
-        bound_circuit.assign_parameters(
-            {parameter: index + offset},
-            inplace=True)
+    bound_circuit.assign_parameters(
+        {parameter: index + offset
+         for index, parameter in enumerate(bound_circuit.parameters)},
+        inplace=True)
 
     return bound_circuit
 
@@ -112,10 +105,14 @@ def test_get_circuit_hash_parameters(litmus_circuit):
     assert circuit_hash != circuit_other_parameters_hash
 
 
-def test_get_circuit_hash_structures(qubits_count):
+def test_get_circuit_hash_structures(qubits_count, session_litmus_circuit):
+
+    # Hashing only reads the circuits - the session litmus circuit can
+    # stand in for a freshly built one; the factories themselves stay
+    # uncached because callers mutate their results
 
     cnot_circuit = get_cnot_circuit(qubits_count, "CNOT")
-    litmus_circuit = get_litmus_circuit(qubits_count, "Litmus")
+    litmus_circuit = session_litmus_circuit
     litmus_circuit_same = get_litmus_circuit(qubits_count, "Litmus_Same")
 
     # Hashes
@@ -14,7 +14,11 @@ AE_QFT_QUBIT_COUNT = 5
 
 OPTIMIZATION_LEVEL = 3
 
-SHOTS_COUNT = 1000
+# 400 shots keep the sampling error on any outcome proportion below
+# ~5% (1.96 * sqrt(0.25 / 400)), half the 10% delta tolerance checked
+# below - simulator time scales linearly with shots
+
+SHOTS_COUNT = 400
 SEED_TRANSPILER = 1234
 
 LAYOUT_METHOD = None
@@ -1,8 +1,7 @@
-from collections import Counter
-
 from qiskit import QuantumCircuit
 from qiskit.converters import circuit_to_dag
 
+from rivet_transpiler import get_gates_counter
 from rivet_transpiler import transpile_and_return_metrics
 
 
@@ -19,11 +18,7 @@ def test_gates_counter():
 
     dag = circuit_to_dag(circuit)
 
-    dag_nodes = dag.op_nodes(include_directives=False)
-
-    qubit_counts = sorted(node.op.num_qubits for node in dag_nodes)
-
-    gates_counter = dict(Counter(qubit_counts))
+    gates_counter = get_gates_counter(dag)
 
     assert gates_counter == {1: 6, 2: 1}
 
@@ -1,20 +1,22 @@
 import pytest
 
-import qiskit
-
-from qiskit_ibm_runtime.fake_provider import FakeLimaV2
-
 from rivet_transpiler import transpile
 from rivet_transpiler import transpile_left
 from rivet_transpiler import transpile_right
 from rivet_transpiler import transpile_chain
 from rivet_transpiler import transpile_and_compress
+from rivet_transpiler import remove_unused_qubits
 
 from rivet_transpiler import get_full_map
-from rivet_transpiler import get_litmus_circuit
 from rivet_transpiler import get_used_qubit_indices
 
 
+# The compress tests warn about ancilla removal - filter once at module
+# scope instead of per test
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
 # Test Transpile Functions
 
 def test_transpile(litmus_circuit, backend):
@@ -50,13 +52,21 @@ def test_transpile_chain(litmus_circuit, backend):
     assert transpiled_chain_circuit
 
 
-def test_transpile_right(litmus_circuit, backend):
+def test_transpile_chain_parallel(litmus_circuit, backend):
 
-    transpiled_litmus_circuit = qiskit.transpile(
-        litmus_circuit,
-        backend,
+    CHAIN = [litmus_circuit] * 3
+
+    transpiled_chain_circuit = transpile_chain(
+        circuits=CHAIN,
+        backend=backend,
+        parallel=True,
         seed_transpiler=1234)
 
+    assert transpiled_chain_circuit
+
+
+def test_transpile_right(litmus_circuit, transpiled_litmus_circuit, backend):
+
     transpiled_right_circuit = transpile_right(
         central_circuit=transpiled_litmus_circuit,
         right_circuit=litmus_circuit,
@@ -66,17 +76,12 @@ def test_transpile_right(litmus_circuit, backend):
     assert transpiled_right_circuit
 
 
-def test_transpile_right_target(litmus_circuit, backend):
+def test_transpile_right_target(litmus_circuit, target_transpiled_litmus_circuit, backend):
 
     target = backend.target if backend else None
 
-    transpiled_litmus_circuit = qiskit.transpile(
-        litmus_circuit,
-        target=target,
-        seed_transpiler=1234)
-
     transpiled_right_circuit = transpile_right(
-        central_circuit=transpiled_litmus_circuit,
+        central_circuit=target_transpiled_litmus_circuit,
         right_circuit=litmus_circuit,
         target=target,
         seed_transpiler=1234)
@@ -92,12 +97,7 @@ def test_transpile_right_target(litmus_circuit, backend):
     assert litmus_qubits_count == transpiled_right_qubits_count
 
 
-def test_transpile_left(litmus_circuit, backend):
-
-    transpiled_litmus_circuit = qiskit.transpile(
-        litmus_circuit,
-        backend,
-        seed_transpiler=1234)
+def test_transpile_left(litmus_circuit, transpiled_litmus_circuit, backend):
 
     transpiled_left_circuit = transpile_left(
         central_circuit=transpiled_litmus_circuit,
@@ -108,7 +108,6 @@ def test_transpile_left(litmus_circuit, backend):
     assert transpiled_left_circuit
 
 
-@pytest.mark.filterwarnings("ignore::UserWarning")
 def test_transpile_and_compress(litmus_circuit, backend):
 
     compressed_litmus_circuit = transpile_and_compress(
@@ -119,20 +118,7 @@ def test_transpile_and_compress(litmus_circuit, backend):
     assert compressed_litmus_circuit
 
 
-@pytest.mark.filterwarnings("ignore::UserWarning")
-def test_transpile_and_compress_coupling_map(litmus_circuit, backend):
-
-    # Coupling Map
-
-    if backend is None:
-        coupling_map = None
-
-    else:
-        coupling_list = backend.configuration().coupling_map
-        coupling_map = qiskit.transpiler.CouplingMap(
-            couplinglist=coupling_list)
-
-    # Transpile and Compress
+def test_transpile_and_compress_coupling_map(litmus_circuit, backend, coupling_map):
 
     compressed_litmus_circuit = transpile_and_compress(
         litmus_circuit,
@@ -143,8 +129,33 @@ def test_transpile_and_compress_coupling_map(litmus_circuit, backend):
     assert compressed_litmus_circuit
 
 
+# Test Remove Unused Qubits
+
+def test_remove_unused_qubits(transpiled_litmus_circuit):
+
+    reduced_litmus_circuit = remove_unused_qubits(transpiled_litmus_circuit)
+
+    used_qubits_count = len(
+        get_used_qubit_indices(
+            transpiled_litmus_circuit))
+
+    assert reduced_litmus_circuit.num_qubits == used_qubits_count
+
+
+def test_remove_unused_qubits_full_map(transpiled_litmus_circuit):
+
+    reduced_litmus_circuit = remove_unused_qubits(transpiled_litmus_circuit)
+
+    full_map = get_full_map(reduced_litmus_circuit)
+
+    assert sorted(full_map) == list(range(reduced_litmus_circuit.num_qubits))
+
+
 # Test Full Map
 
+EXPECTED_FULL_MAP = (0, 2, 1, 3, 4)
+
+
 def test_full_map(litmus_circuit, backend):
 
     transpiled_litmus_circuit = transpile(
@@ -157,17 +168,13 @@ def test_full_map(litmus_circuit, backend):
     assert full_map
 
 
-def test_full_map_value():
-
-    fixed_litmus_circuit = get_litmus_circuit(qubits_count=3)
-
-    backend = FakeLimaV2()
+def test_full_map_value(fixed_litmus_circuit, fake_lima_backend):
 
     transpiled_litmus_circuit = transpile(
         fixed_litmus_circuit,
-        backend,
+        fake_lima_backend,
         seed_transpiler=1234)
 
     full_map = get_full_map(transpiled_litmus_circuit)
 
-    assert full_map == [0, 2, 1, 3, 4]
+    assert full_map == EXPECTED_FULL_MAP